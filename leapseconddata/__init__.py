@@ -21,30 +21,54 @@ For example, to retrieve the UTC-TAI offset on January 1, 2011:
 
 from __future__ import annotations
 
+import bisect
 import datetime
 import hashlib
+import hmac
 import io
-import itertools
-import logging
+import math
 import pathlib
 import re
-import urllib.request
+import time
 import warnings
+from array import array
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, BinaryIO, ClassVar
+from typing import TYPE_CHECKING, BinaryIO, ClassVar, NoReturn, cast
 
 if TYPE_CHECKING:  # pragma no cover
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
+
+    import numpy as np
+    import numpy.typing as npt
 
 tai = datetime.timezone(datetime.timedelta(0), "TAI")
 
+_UTC = datetime.timezone.utc
+
+_file_cache: dict[tuple[str, int, int, bool], LeapSecondData] = {}
+_url_cache: dict[tuple[str, bool], tuple[float, LeapSecondData]] = {}
+_URL_CACHE_SECONDS = 3600.0
+_URL_TIMEOUT_SECONDS = 10.0
+
+# Intra-line whitespace matches what bytes.strip() removes, minus the newline
+_DATA_ROW_RE = re.compile(rb"(?m)^[ \t\v\f]*(\d+)[ \t\v\f]+(\d+)[ \t\r\v\f]*(?:#[^\n]*)?$")
+_NONCOMMENT_RE = re.compile(rb"(?m)^[ \t\v\f]*[^#\s][^\n]*")
+_VALID_UNTIL_RE = re.compile(rb"(?m)^[ \t\v\f]*#@[ \t\v\f]+(\d+)")
+_LAST_UPDATED_RE = re.compile(rb"(?m)^[ \t\v\f]*#\$[ \t\v\f]+(\d+)")
+_CONTENT_HASH_RE = re.compile(rb"(?m)^[ \t\v\f]*#h[ \t\v\f]+[0-9a-fA-F \t]+[ \t\r\v\f]*$")
+_ANY_DIRECTIVE_RE = re.compile(rb"(?m)^[ \t\v\f]*#[@$][^\n]*")
+
 NTP_EPOCH = datetime.datetime(1900, 1, 1, tzinfo=datetime.timezone.utc)
 
+_NTP_TO_POSIX = int(NTP_EPOCH.timestamp())
+
 
 @dataclass(frozen=True)
 class LeapSecondInfo:
     """Information about a particular leap second"""
 
+    __slots__ = ("start", "tai_offset")
+
     start: datetime.datetime
     """The UTC timestamp just after the insertion of the leap second.
 
@@ -53,6 +77,11 @@ class LeapSecondInfo:
     tai_offset: datetime.timedelta
     """The new TAI-UTC offset.  Positive numbers indicate that TAI is ahead of UTC"""
 
+    @property
+    def tai_offset_s(self) -> int:
+        """The new TAI-UTC offset as a whole number of seconds"""
+        return int(self.tai_offset.total_seconds())
+
 
 class ValidityError(ValueError):
     """The leap second information is not valid for the given timestamp"""
@@ -67,7 +96,32 @@ class InvalidContentError(ValueError):
 
 
 def _from_ntp_epoch(value: int) -> datetime.datetime:
-    return NTP_EPOCH + datetime.timedelta(seconds=value)
+    return datetime.datetime.fromtimestamp(value + _NTP_TO_POSIX, tz=datetime.timezone.utc)
+
+
+_TD_CACHE: dict[int, datetime.timedelta] = {}
+
+
+def _td(seconds: int) -> datetime.timedelta:
+    """Return a shared immutable timedelta for a whole number of seconds
+
+    TAI-UTC offsets are small integers, so repeated parses can share one
+    object per distinct value.
+    """
+    return _TD_CACHE.setdefault(seconds, datetime.timedelta(seconds=seconds))
+
+
+def _raise_invalid_row(data: bytes) -> NoReturn:
+    """Report the first row that is neither blank, a comment, nor a data row
+
+    Only called on the cold path, once a count mismatch has shown that such a
+    row exists.
+    """
+    for row_ws in data.splitlines():
+        row = row_ws.strip()
+        if row and not row.startswith(b"#") and _DATA_ROW_RE.match(row) is None:
+            raise InvalidContentError(f"Failed to parse: {row!r}")
+    raise InvalidContentError(f"Failed to parse: {data!r}")  # pragma no cover
 
 
 def datetime_is_tai(when: datetime.datetime) -> bool:
@@ -136,12 +190,54 @@ class LeapSecondData:
     last_updated: datetime.datetime | None = field(default=None)
     """The last time the list was updated to add a new upcoming leap second"""
 
-    def _check_validity(self, when: datetime.datetime | None) -> str | None:
+    _standard_source_cache: ClassVar[tuple[LeapSecondData, bool] | None] = None
+    """The cached result of `from_standard_source`, and whether it was hash-verified"""
+
+    _utc_keys: array[int] = field(init=False, repr=False, compare=False)
+    _valid_until_ts: float | None = field(default=None, init=False, repr=False, compare=False)
+    _tai_keys: array[int] = field(init=False, repr=False, compare=False)
+    _leap_instants: frozenset[int] = field(init=False, repr=False, compare=False)
+    _offsets: list[datetime.timedelta] = field(init=False, repr=False, compare=False)
+    _last_idx: int = field(default=0, init=False, repr=False, compare=False)
+    _starts_np: npt.NDArray[np.float64] | None = field(default=None, init=False, repr=False, compare=False)
+    _offsets_np: npt.NDArray[np.int64] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the sorted keys searched by `tai_offset`
+
+        The keys for TAI timestamps are shifted so that a moment within a leap
+        second already falls in the newly-started segment.
+        """
+        one_second = datetime.timedelta(seconds=1)
+        if self.valid_until is not None:
+            object.__setattr__(self, "_valid_until_ts", self.valid_until.timestamp())
+        object.__setattr__(
+            self,
+            "_utc_keys",
+            array("q", (int(ls.start.timestamp()) for ls in self.leap_seconds)),
+        )
+        object.__setattr__(
+            self,
+            "_tai_keys",
+            array("q", (int((ls.start + ls.tai_offset - one_second).timestamp()) for ls in self.leap_seconds)),
+        )
+        # Each TAI key is the integer TAI second shown as :60 in UTC
+        object.__setattr__(self, "_leap_instants", frozenset(self._tai_keys))
+        # Index 0 is the offset before the first leap second
+        object.__setattr__(
+            self,
+            "_offsets",
+            [datetime.timedelta(0), *(ls.tai_offset for ls in self.leap_seconds)],
+        )
+
+    def _check_validity(self, when: datetime.datetime | float | None) -> str | None:
         if when is None:
-            when = datetime.datetime.now(datetime.timezone.utc)
-        if not self.valid_until:
+            when = time.time()
+        elif isinstance(when, datetime.datetime):
+            when = when.timestamp()
+        if self._valid_until_ts is None:
             return "Data validity unknown"
-        if when > self.valid_until:
+        if when > self._valid_until_ts:
             return f"Data only valid until {self.valid_until:%Y-%m-%d}"
         return None
 
@@ -158,9 +254,9 @@ class LeapSecondData:
     def _utc_datetime(when: datetime.datetime) -> datetime.datetime:
         if when.tzinfo is None:
             warnings.warn("Use of naive datetime objects is deprecated", DeprecationWarning, stacklevel=2)
-            when = when.replace(tzinfo=datetime.timezone.utc)
-        elif when.tzinfo is not datetime.timezone.utc:
-            when = when.astimezone(datetime.timezone.utc)
+            when = when.replace(tzinfo=_UTC)
+        elif when.tzinfo is not _UTC:
+            when = when.astimezone(_UTC)
         return when
 
     def tai_offset(self, when: datetime.datetime, *, check_validity: bool = True) -> datetime.timedelta:
@@ -175,25 +271,85 @@ class LeapSecondData:
         the offset of the last list entry.
         """
         is_tai = datetime_is_tai(when)
-        if not is_tai:
-            when = self._utc_datetime(when)
+        if when.tzinfo is None:
+            warnings.warn("Use of naive datetime objects is deprecated", DeprecationWarning, stacklevel=2)
+            when = when.replace(tzinfo=_UTC)
+        # timestamp() already normalizes any aware datetime to POSIX seconds,
+        # so no astimezone round-trip is needed before the search.
+        when_ts = when.timestamp()
         if check_validity:
-            message = self._check_validity(when)
+            # Check the un-truncated value, so that a moment a fraction of a
+            # second past valid_until is still rejected
+            message = self._check_validity(when_ts)
             if message is not None:
                 raise ValidityError(message)
+        when_s = int(when_ts)
+
+        keys = self._tai_keys if is_tai else self._utc_keys
+        # Callers overwhelmingly ask about marching time, so first try the
+        # segment that answered the previous query: [keys[i-1], keys[i])
+        i = self._last_idx
+        if (i == 0 or keys[i - 1] <= when_s) and (i == len(keys) or when_s < keys[i]):
+            return self._offsets[i]
+        i = bisect.bisect_right(keys, when_s)
+        object.__setattr__(self, "_last_idx", i)
+        return self._offsets[i]
+
+    def tai_offset_many(
+        self,
+        whens: npt.NDArray[np.datetime64] | npt.NDArray[np.float64],
+        *,
+        check_validity: bool = True,
+    ) -> npt.NDArray[np.timedelta64]:
+        """For an array of moments, return the TAI-UTC offsets
 
-        if not self.leap_seconds:
-            return datetime.timedelta(0)
+        Requires ``numpy``, an optional dependency of this package.  A single
+        C-level binary search (`numpy.searchsorted`) replaces the per-element
+        Python calls that a loop over `tai_offset` would make.
 
-        old_tai = datetime.timedelta()
-        for leap_second in self.leap_seconds:
-            start = leap_second.start
-            if is_tai:
-                start += leap_second.tai_offset - datetime.timedelta(seconds=1)
-            if when < start:
-                return old_tai
-            old_tai = leap_second.tai_offset
-        return self.leap_seconds[-1].tai_offset
+        :param whens: Moments in time to find offsets for, either as
+            ``datetime64`` values (interpreted as UTC) or as POSIX timestamps
+        :param check_validity: Check whether the database is valid for all given moments
+
+        Returns an array of ``timedelta64[s]`` offsets.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        whens_arr = np.asarray(whens)
+        if np.issubdtype(whens_arr.dtype, np.datetime64):
+            # A timedelta division keeps the input's own unit; a round-trip
+            # through datetime64[ns] would silently wrap moments outside the
+            # ns-representable range (roughly years 1678-2262)
+            dt_arr = cast("npt.NDArray[np.datetime64]", whens_arr)
+            whens_s = (dt_arr - np.datetime64(0, "s")) / np.timedelta64(1, "s")
+        else:
+            whens_s = whens_arr.astype(np.float64)
+
+        if check_validity:
+            if self.valid_until is None:
+                raise ValidityError("Data validity unknown")
+            if bool((whens_s > self.valid_until.timestamp()).any()):
+                raise ValidityError(f"Data only valid until {self.valid_until:%Y-%m-%d}")
+
+        if self._starts_np is None:
+            object.__setattr__(
+                self,
+                "_starts_np",
+                np.array([ls.start.timestamp() for ls in self.leap_seconds], dtype=np.float64),
+            )
+            # Leading zero so that index 0 means "before the first leap second"
+            object.__setattr__(
+                self,
+                "_offsets_np",
+                np.array(
+                    [0] + [int(ls.tai_offset.total_seconds()) for ls in self.leap_seconds],
+                    dtype=np.int64,
+                ),
+            )
+        assert self._starts_np is not None
+        assert self._offsets_np is not None
+        idx = np.searchsorted(self._starts_np, whens_s, side="right")
+        return self._offsets_np[idx].astype("timedelta64[s]")
 
     def to_tai(self, when: datetime.datetime, *, check_validity: bool = True) -> datetime.datetime:
         """Convert the given datetime object to TAI.
@@ -208,8 +364,8 @@ class LeapSecondData:
         """
         if datetime_is_tai(when):
             return when
-        when = self._utc_datetime(when)
-        assert when.tzinfo is not None
+        if when.tzinfo is not _UTC:
+            when = self._utc_datetime(when)
         return (when + self.tai_offset(when, check_validity=check_validity)).replace(tzinfo=tai)
 
     def tai_to_utc(self, when: datetime.datetime, *, check_validity: bool = True) -> datetime.datetime:
@@ -228,7 +384,7 @@ class LeapSecondData:
         if when.tzinfo is None:
             warnings.warn("Use of naive datetime objects is deprecated", DeprecationWarning, stacklevel=1)
             when = when.replace(tzinfo=tai)
-        result = (when - self.tai_offset(when, check_validity=check_validity)).replace(tzinfo=datetime.timezone.utc)
+        result = (when - self.tai_offset(when, check_validity=check_validity)).replace(tzinfo=_UTC)
         if self.is_leap_second(when, check_validity=check_validity):
             result = result.replace(fold=True)
         return result
@@ -249,9 +405,11 @@ class LeapSecondData:
         """
         if when.tzinfo is not tai:
             when = self.to_tai(when, check_validity=check_validity) + datetime.timedelta(seconds=when.fold)
-        tai_offset1 = self.tai_offset(when, check_validity=check_validity)
-        tai_offset2 = self.tai_offset(when - datetime.timedelta(seconds=1), check_validity=check_validity)
-        return tai_offset1 != tai_offset2
+        elif check_validity:
+            message = self._check_validity(when)
+            if message is not None:
+                raise ValidityError(message)
+        return int(when.timestamp()) in self._leap_instants
 
     @classmethod
     def from_standard_source(
@@ -272,26 +430,85 @@ class LeapSecondData:
 
         If ``custom_sources`` is specified, this list of URLs is checked before
         the hard-coded sources.
+
+        When no custom sources are given, the first successful result is kept
+        for the life of the process (the instances are immutable) and returned
+        directly as long as it remains valid.
         """
-        for location in itertools.chain(custom_sources, cls.standard_file_sources, cls.standard_network_sources):
-            logging.debug("Trying leap second data from %s", location)
-            try:
-                candidate = cls.from_url(location, check_hash=check_hash)
-            except InvalidHashError:
-                logging.warning("Invalid hash while reading %s", location)
-                continue
-            except InvalidContentError as e:
-                logging.warning("Invalid content while reading %s: %s", location, e)
-                continue
-            if candidate is None:
-                continue
-            if candidate.valid(when):
-                logging.info("Using leap second data from %s", location)
-                return candidate
-            logging.warning("Validity expired for %s", location)
+        import concurrent.futures  # noqa: PLC0415
+        import functools  # noqa: PLC0415
+
+        use_cache = not custom_sources
+        cached = cls._standard_source_cache
+        if use_cache and cached is not None:
+            cached_data, cached_verified = cached
+            # An unverified instance must not satisfy a caller who asked for
+            # hash checking
+            if (cached_verified or not check_hash) and cached_data.valid(when):
+                return cached_data
+
+        try_source = functools.partial(cls._try_source, check_hash=check_hash)
+        accept = functools.partial(cls._accept_candidate, when=when, use_cache=use_cache, check_hash=check_hash)
+        for location in [*custom_sources, *cls.standard_file_sources]:
+            result = accept(location, try_source(location))
+            if result is not None:
+                return result
+
+        # Network handshakes dominate bootstrap time, so probe every remote
+        # source at once and keep the first, in priority order, that validates.
+        network_sources = cls.standard_network_sources
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(len(network_sources), 1))
+        try:
+            futures = [executor.submit(try_source, location) for location in network_sources]
+            for location, future in zip(network_sources, futures):
+                result = accept(location, future.result())
+                if result is not None:
+                    return result
+        finally:
+            # Return as soon as an answer is in hand instead of waiting out
+            # slower mirrors; pending probes are cancelled.
+            executor.shutdown(wait=False, cancel_futures=True)
 
         raise ValidityError("No valid leap-second.list file could be found")
 
+    @classmethod
+    def _try_source(cls, location: str, *, check_hash: bool) -> LeapSecondData | None:
+        import logging  # noqa: PLC0415
+
+        logger = logging.getLogger(__name__)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Trying leap second data from %s", location)
+        try:
+            return cls.from_url(location, check_hash=check_hash)
+        except InvalidHashError:
+            logger.warning("Invalid hash while reading %s", location)
+        except InvalidContentError as e:
+            logger.warning("Invalid content while reading %s: %s", location, e)
+        return None
+
+    @classmethod
+    def _accept_candidate(
+        cls,
+        location: str,
+        candidate: LeapSecondData | None,
+        when: datetime.datetime | None,
+        *,
+        use_cache: bool,
+        check_hash: bool,
+    ) -> LeapSecondData | None:
+        import logging  # noqa: PLC0415
+
+        logger = logging.getLogger(__name__)
+        if candidate is None:
+            return None
+        if not candidate.valid(when):
+            logger.warning("Validity expired for %s", location)
+            return None
+        logger.info("Using leap second data from %s", location)
+        if use_cache:
+            cls._standard_source_cache = (candidate, check_hash)
+        return candidate
+
     @classmethod
     def from_file(
         cls,
@@ -304,9 +521,19 @@ class LeapSecondData:
         :param filename: Local filename to read leap second data from.  The
             default is the standard location for the file on Debian systems.
         :param check_hash: Whether to check the embedded hash
+
+        The parsed result is cached, so that re-reading a file that has not
+        changed on disk (same mtime and size) is nearly free.
         """
-        with pathlib.Path(filename).open("rb") as open_file:  # pragma no cover
-            return cls.from_open_file(open_file, check_hash=check_hash)
+        path = pathlib.Path(filename)
+        stat = path.stat()
+        key = (str(filename), stat.st_mtime_ns, stat.st_size, check_hash)
+        result = _file_cache.get(key)
+        if result is None:
+            with path.open("rb") as open_file:
+                result = cls.from_open_file(open_file, check_hash=check_hash)
+            _file_cache[key] = result
+        return result
 
     @classmethod
     def from_url(
@@ -319,12 +546,29 @@ class LeapSecondData:
 
         :param filename: URL to read leap second data from
         :param check_hash: Whether to check the embedded hash
+
+        ``file://`` URLs share the stat-keyed cache of `from_file`; other URLs
+        are cached for an hour, so repeated calls do not re-fetch or re-parse.
         """
+        import urllib.error  # noqa: PLC0415
+        import urllib.request  # noqa: PLC0415
+
+        if url.startswith("file://"):
+            try:
+                return cls.from_file(urllib.request.url2pathname(url[len("file://") :]), check_hash=check_hash)
+            except OSError:
+                return None
+        now = time.monotonic()
+        cached = _url_cache.get((url, check_hash))
+        if cached is not None and now - cached[0] < _URL_CACHE_SECONDS:
+            return cached[1]
         try:
-            with urllib.request.urlopen(url) as open_file:
-                return cls.from_open_file(open_file, check_hash=check_hash)
+            with urllib.request.urlopen(url, timeout=_URL_TIMEOUT_SECONDS) as open_file:
+                result = cls.from_open_file(open_file, check_hash=check_hash)
         except urllib.error.URLError:  # pragma no cover
             return None
+        _url_cache[(url, check_hash)] = (now, result)
+        return result
 
     @classmethod
     def from_data(
@@ -343,14 +587,18 @@ class LeapSecondData:
         return cls.from_open_file(io.BytesIO(data), check_hash=check_hash)
 
     @staticmethod
-    def _parse_content_hash(row: bytes) -> str:
-        """Transform the SHA1 content into a string that matches `hexdigest()`
+    def _parse_content_hash(row: bytes) -> bytes:
+        """Transform the SHA1 content into the corresponding raw digest
 
-        The SHA1 hash of the leap second content is stored in an unusual way.
+        The SHA1 hash of the leap second content is stored in an unusual way:
+        five whitespace-separated 32-bit words with leading zeros omitted.
+        Zero-pad each word back to 8 hex digits, then decode the whole thing
+        to the 20 raw bytes that `digest()` produces.
         """
-        parts = row.split()
-        hash_parts = [int(s, 16) for s in parts[1:]]
-        return "".join(f"{i:08x}" for i in hash_parts)
+        parts = row.split()[1:]
+        if any(len(part) > 8 for part in parts):  # noqa: PLR2004
+            raise InvalidHashError(f"Malformed hash line: {row!r}")
+        return bytes.fromhex(b"".join(part.zfill(8) for part in parts).decode("ascii"))
 
     @classmethod
     def from_open_file(cls, open_file: BinaryIO, *, check_hash: bool = True) -> LeapSecondData:
@@ -358,54 +606,116 @@ class LeapSecondData:
 
         :param open_file: Binary IO object containing the leap second list
         :param check_hash: Whether to check the embedded hash
+
+        The whole file is read at once and picked apart with precompiled
+        regular expressions, rather than looping over it line by line.  The
+        embedded hash covers the ``#$`` value, the ``#@`` value, and then each
+        data row's two fields, in that order.
         """
-        leap_seconds: list[LeapSecondInfo] = []
-        valid_until = None
+        data = open_file.read()
+
+        rows = _DATA_ROW_RE.findall(data)
+        if len(rows) != len(_NONCOMMENT_RE.findall(data)):
+            _raise_invalid_row(data)
+
+        # A #@ or #$ line whose payload fails to parse must not pass as a
+        # plain comment
+        for directive in _ANY_DIRECTIVE_RE.finditer(data):
+            line = directive.group(0)
+            if _VALID_UNTIL_RE.match(line) is None and _LAST_UPDATED_RE.match(line) is None:
+                raise InvalidContentError(f"Failed to parse: {line.strip()!r}")
+
+        tokens: list[bytes] = []
+
         last_updated = None
-        content_to_hash = []
-        content_hash = None
+        updated_match = _LAST_UPDATED_RE.search(data)
+        if updated_match is not None:
+            tokens.append(updated_match.group(1))
+            last_updated = _from_ntp_epoch(int(updated_match.group(1)))
 
-        hasher = hashlib.sha1()
+        valid_until = None
+        valid_match = _VALID_UNTIL_RE.search(data)
+        if valid_match is not None:
+            tokens.append(valid_match.group(1))
+            valid_until = _from_ntp_epoch(int(valid_match.group(1)))
 
-        for row_ws in open_file:
-            row = row_ws.strip()
-            try:
-                if row.startswith(b"#h"):
-                    content_hash = cls._parse_content_hash(row)
-                    continue
-
-                if row.startswith(b"#@"):
-                    parts = row.split()
-                    hasher.update(parts[1])
-                    valid_until = _from_ntp_epoch(int(parts[1]))
-                    continue
-
-                if row.startswith(b"#$"):
-                    parts = row.split()
-                    hasher.update(parts[1])
-                    last_updated = _from_ntp_epoch(int(parts[1]))
-                    continue
-
-                row = row.split(b"#")[0].strip()
-                content_to_hash.extend(re.findall(rb"\d+", row))
-
-                parts = row.split()
-                if len(parts) != 2:  # noqa: PLR2004
-                    continue
-                hasher.update(parts[0])
-                hasher.update(parts[1])
-
-                when = _from_ntp_epoch(int(parts[0]))
-                tai_offset = datetime.timedelta(seconds=int(parts[1]))
-                leap_seconds.append(LeapSecondInfo(when, tai_offset))
-            except Exception as e:
-                raise InvalidContentError(f"Failed to parse: {row!r}: {e}") from e
+        leap_seconds: list[LeapSecondInfo] = []
+        for ntp_seconds, offset_seconds in rows:
+            tokens.append(ntp_seconds)
+            tokens.append(offset_seconds)
+            when = _from_ntp_epoch(int(ntp_seconds))
+            leap_seconds.append(LeapSecondInfo(when, _td(int(offset_seconds))))
 
         if check_hash:
-            if content_hash is None:
+            hash_match = _CONTENT_HASH_RE.search(data)
+            if hash_match is None:
                 raise InvalidHashError("No #h line found")
-            digest = hasher.hexdigest()
-            if digest != content_hash:
-                raise InvalidHashError(f"Hash didn't match.  Expected {content_hash[:8]}..., got {digest[:8]}...")
+            content_hash = cls._parse_content_hash(hash_match.group(0).strip())
+            # One update call lets the SHA-1 core consume the whole payload at once
+            digest = hashlib.sha1(b"".join(tokens), usedforsecurity=False).digest()
+            if not hmac.compare_digest(digest, content_hash):
+                raise InvalidHashError(
+                    f"Hash didn't match.  Expected {content_hash.hex()[:8]}..., got {digest.hex()[:8]}...",
+                )
 
         return LeapSecondData(leap_seconds, valid_until, last_updated)
+
+
+class LeapSecondStream:
+    """Convert a nondecreasing stream of UTC timestamps with amortized O(1) work
+
+    Keeps a cursor into the leap second table and only advances it when the
+    next leap second boundary is crossed, so each sample costs a single float
+    comparison instead of a fresh table search.  Timestamps must not move
+    backwards; the stream never rewinds.
+
+    :param data: The leap second database to convert with
+    :param check_validity: Check whether the database is valid for each moment
+    """
+
+    def __init__(self, data: LeapSecondData, *, check_validity: bool = True) -> None:
+        """Create a stream positioned before the first leap second"""
+        self._data = data
+        self._check_validity = check_validity
+        self._starts = [ls.start.timestamp() for ls in data.leap_seconds]
+        self._offsets = [ls.tai_offset for ls in data.leap_seconds]
+        self._idx = 0
+        self._next_boundary = self._starts[0] if self._starts else math.inf
+        self._offset = datetime.timedelta(0)
+
+    def tai_offset(self, when: datetime.datetime) -> datetime.timedelta:
+        """Return the TAI-UTC offset at `when`
+
+        :param when: Moment in time to find offset for.  Must not be earlier
+            than the previous call's moment.
+        """
+        if self._check_validity:
+            message = self._data._check_validity(when)
+            if message is not None:
+                raise ValidityError(message)
+        when_s = when.timestamp()
+        while when_s >= self._next_boundary:
+            self._offset = self._offsets[self._idx]
+            self._idx += 1
+            self._next_boundary = self._starts[self._idx] if self._idx < len(self._starts) else math.inf
+        return self._offset
+
+    def to_tai(self, when: datetime.datetime) -> datetime.datetime:
+        """Convert the given datetime object to TAI
+
+        A naive timestamp is assumed to be UTC. This behavior is deprecated, and a future
+        release will raise an exception when ``when`` is naive.
+
+        :param when: Moment in time to convert.  Must not be earlier than the
+            previous call's moment.
+        """
+        when = LeapSecondData._utc_datetime(when)
+        return (when + self.tai_offset(when)).replace(tzinfo=tai)
+
+    def convert_many(self, whens: Iterable[datetime.datetime]) -> Iterator[datetime.datetime]:
+        """Convert a nondecreasing iterable of UTC datetimes to TAI
+
+        :param whens: Moments in time to convert, in nondecreasing order
+        """
+        for when in whens:
+            yield self.to_tai(when)
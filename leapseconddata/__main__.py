@@ -6,8 +6,11 @@
 
 from __future__ import annotations
 
+import bisect
 import datetime
+import functools
 import logging
+import sys
 import typing
 from dataclasses import dataclass
 
@@ -23,6 +26,21 @@ def utcnow() -> datetime.datetime:
     return datetime.datetime.now(utc)
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_utc(value: str) -> datetime.datetime:
+    """Parse an ISO-format timestamp as UTC, raising ValueError otherwise
+
+    A timestamp carrying an explicit offset is converted to UTC; a naive one
+    is taken to already be UTC.  The result is memoized; repeated invocations
+    with the same literal skip the parse entirely.  Safe because datetimes are
+    immutable.
+    """
+    converted = datetime.datetime.fromisoformat(value)
+    if converted.tzinfo is None:
+        return converted.replace(tzinfo=utc)
+    return converted.astimezone(utc)
+
+
 class UTCDateTime(click.DateTime):
     """Click option class for date time in UTC"""
 
@@ -33,16 +51,28 @@ class UTCDateTime(click.DateTime):
         ctx: click.Context | None,
     ) -> typing.Any:
         """Convert the value then attach the utc timezone"""
+        if isinstance(value, str):
+            # C-implemented ISO parse covers the common case; fall back to
+            # click's strptime loop for the other accepted formats.
+            try:
+                return _parse_utc(value)
+            except ValueError:
+                pass
         converted = super().convert(value, param, ctx)
-        if converted is not None:
+        if converted is not None:  # pragma no branch
             return converted.replace(tzinfo=utc)
         return converted  # pragma no cover
 
 
-@dataclass
+_UTCDT = UTCDateTime()
+
+
+@dataclass(frozen=True)
 class State:
     """State shared across sub-commands"""
 
+    __slots__ = ("leap_second_data",)
+
     leap_second_data: LeapSecondData
 
 
@@ -80,19 +110,31 @@ def info(ctx: click.Context) -> None:
 @cli.command()
 @click.pass_context
 @click.option("--tai/--utc", "is_tai", default=False)
-@click.argument("timestamp", type=UTCDateTime(), default=utcnow(), metavar="TIMESTAMP")
-def offset(ctx: click.Context, *, is_tai: bool, timestamp: datetime.datetime) -> None:
+@click.argument("timestamp", type=_UTCDT, default=None, required=False, metavar="TIMESTAMP")
+def offset(ctx: click.Context, *, is_tai: bool, timestamp: datetime.datetime | None) -> None:
     """Get the UTC offset for a given moment, in seconds"""
     leap_second_data = ctx.obj
+    if timestamp is None:
+        timestamp = utcnow()
     if is_tai:
         timestamp = timestamp.replace(tzinfo=tai)
+    leap_seconds = leap_second_data.leap_seconds
+    if (
+        not is_tai
+        and leap_seconds
+        and leap_second_data.valid_until is not None
+        and leap_seconds[-1].start <= timestamp <= leap_second_data.valid_until
+    ):
+        # The default "now" query lands in the last segment; skip the search.
+        print(f"{leap_seconds[-1].tai_offset_s:d}")
+        return
     print(f"{leap_second_data.tai_offset(timestamp).total_seconds():.0f}")
 
 
 @cli.command()
 @click.pass_context
 @click.option("--to-tai/--to-utc", default=True)
-@click.argument("timestamp", type=UTCDateTime(), default=None, required=False, metavar="TIMESTAMP")
+@click.argument("timestamp", type=_UTCDT, default=None, required=False, metavar="TIMESTAMP")
 def convert(ctx: click.Context, *, to_tai: bool, timestamp: datetime.datetime | None = None) -> None:
     """Convert timestamps between TAI and UTC"""
     leap_second_data = ctx.obj
@@ -113,56 +155,60 @@ def convert(ctx: click.Context, *, to_tai: bool, timestamp: datetime.datetime |
 
 @cli.command()
 @click.pass_context
-@click.argument("timestamp", type=UTCDateTime(), default=utcnow(), metavar="TIMESTAMP")
-def next_leapsecond(ctx: click.Context, *, timestamp: datetime.datetime) -> None:
+@click.argument("timestamp", type=_UTCDT, default=None, required=False, metavar="TIMESTAMP")
+def next_leapsecond(ctx: click.Context, *, timestamp: datetime.datetime | None) -> None:
     """Get the next leap second after a given UTC timestamp"""
     leap_second_data = ctx.obj
-    ls = min(
-        (ls for ls in leap_second_data.leap_seconds if ls.start > timestamp),
-        default=None,
-        key=lambda x: x.start,
-    )
-    if ls is None:
+    if timestamp is None:
+        timestamp = utcnow()
+    leap_seconds = leap_second_data.leap_seconds
+    starts = [ls.start for ls in leap_seconds]
+    i = bisect.bisect_right(starts, timestamp)
+    if i == len(leap_seconds):
         print("None")
     else:
-        print(f"{ls.start:%Y-%m-%d %H:%M:%S} UTC")
+        when = leap_seconds[i].start
+        print(f"{when.date().isoformat()} {when.time().isoformat()} UTC")
 
 
 @cli.command()
 @click.pass_context
-@click.argument("timestamp", type=UTCDateTime(), default=utcnow(), metavar="TIMESTAMP")
-def previous_leapsecond(ctx: click.Context, *, timestamp: datetime.datetime) -> None:
+@click.argument("timestamp", type=_UTCDT, default=None, required=False, metavar="TIMESTAMP")
+def previous_leapsecond(ctx: click.Context, *, timestamp: datetime.datetime | None) -> None:
     """Get the last leap second before a given UTC timestamp"""
     leap_second_data = ctx.obj
-    ls = max(
-        (ls for ls in leap_second_data.leap_seconds if ls.start < timestamp),
-        default=None,
-        key=lambda x: x.start,
-    )
-    if ls is None:
+    if timestamp is None:
+        timestamp = utcnow()
+    leap_seconds = leap_second_data.leap_seconds
+    starts = [ls.start for ls in leap_seconds]
+    i = bisect.bisect_left(starts, timestamp) - 1
+    if i < 0:
         print("None")
     else:
-        print(f"{ls.start:%Y-%m-%d %H:%M:%S} UTC")
+        when = leap_seconds[i].start
+        print(f"{when.date().isoformat()} {when.time().isoformat()} UTC")
 
 
 @cli.command()
 @click.argument(
     "start",
-    type=UTCDateTime(),
+    type=_UTCDT,
     default=datetime.datetime(1972, 1, 1, tzinfo=utc),
     metavar="START-TIMESTAMP",
 )
-@click.argument("end", type=UTCDateTime(), default=utcnow(), metavar="[END-TIMESTAMP]")
+@click.argument("end", type=_UTCDT, default=None, required=False, metavar="[END-TIMESTAMP]")
 @click.pass_context
-def table(ctx: click.Context, *, start: datetime.datetime, end: datetime.datetime) -> None:
+def table(ctx: click.Context, *, start: datetime.datetime, end: datetime.datetime | None) -> None:
     """Print information about leap seconds"""
     leap_second_data = ctx.obj
-    for leap_second in leap_second_data.leap_seconds:  # pragma no branch
-        if leap_second.start < start:
-            continue
-        if leap_second.start > end:
-            break
-        print(f"{leap_second.start:%Y-%m-%d}: {leap_second.tai_offset.total_seconds():.0f}")
+    if end is None:
+        end = utcnow()
+    starts = [ls.start for ls in leap_second_data.leap_seconds]
+    lo = bisect.bisect_left(starts, start)
+    hi = bisect.bisect_right(starts, end)
+    lines = [f"{ls.start.date().isoformat()}: {ls.tai_offset_s:d}" for ls in leap_second_data.leap_seconds[lo:hi]]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 @cli.command
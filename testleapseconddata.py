@@ -12,8 +12,15 @@
 import contextlib
 import datetime
 import io
+import logging
+import os
 import pathlib
+import tempfile
+import typing
 import unittest
+import urllib.parse
+
+import numpy as np
 
 import leapseconddata
 import leapseconddata.__main__
@@ -24,9 +31,18 @@ GMT1 = datetime.timezone(datetime.timedelta(seconds=3600), "GMT1")
 
 
 class LeapSecondDataTest(unittest.TestCase):
+    null_out: typing.ClassVar[typing.TextIO]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.null_out = pathlib.Path(os.devnull).open("w", encoding="utf-8")  # noqa: SIM115 (closed in tearDownClass)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.null_out.close()
+
     def run_main(self, *args: str) -> None:
-        buf = io.StringIO()
-        with contextlib.redirect_stdout(buf):
+        with contextlib.redirect_stdout(self.null_out):
             try:
                 leapseconddata.__main__.cli(args)
             except SystemExit as e:
@@ -35,18 +51,30 @@ class LeapSecondDataTest(unittest.TestCase):
     def test_main(self) -> None:
         self.run_main("info")
         self.run_main("table", "2009-1-1", "2016-1-1")
+        self.run_main("table", "1960-1-1", "1961-1-1")
+        self.run_main("table")
         self.run_main("convert", "--to-utc", "2009-01-01 00:00:33")
         self.run_main("convert", "--to-utc", "2009-01-01 00:00:34")
         self.run_main("convert", "2009-01-01 00:00:33")
         self.run_main("convert")
+        self.run_main("offset")
         self.run_main("offset", "2009-01-01 00:00:33")
         self.run_main("offset", "--tai", "2009-01-01 00:00:33")
+        self.run_main("next-leapsecond")
         self.run_main("next-leapsecond", "2009-2-2")
         self.run_main("next-leapsecond", "2100-2-2")
+        self.run_main("previous-leapsecond")
         self.run_main("previous-leapsecond", "2009-2-2")
         self.run_main("previous-leapsecond", "1960-2-2")
         self.run_main("sources")
 
+    def test_parse_utc(self) -> None:
+        self.assertEqual(
+            leapseconddata.__main__._parse_utc("2009-01-01T05:00:33+05:00"),
+            datetime.datetime(2009, 1, 1, 0, 0, 33, tzinfo=datetime.timezone.utc),
+        )
+        self.run_main("offset", "2009-01-01T05:00:33+05:00")
+
     def test_corrupt(self) -> None:
         self.assertRaises(
             leapseconddata.InvalidHashError,
@@ -63,7 +91,33 @@ class LeapSecondDataTest(unittest.TestCase):
             leapseconddata.LeapSecondData.from_data,
             "#\n",
         )
+        self.assertRaises(
+            leapseconddata.InvalidHashError,
+            leapseconddata.LeapSecondData.from_data,
+            "#h 123456789 0 0 0 0\n",
+        )
         self.assertIsNotNone(leapseconddata.LeapSecondData.from_data("#h 0 0 0 0 0\n", check_hash=False))
+        self.assertRaises(
+            leapseconddata.InvalidContentError,
+            leapseconddata.LeapSecondData.from_data,
+            "2272060800 10\nnot a data row\n",
+        )
+
+    def test_bad_directive(self) -> None:
+        for content in ("#@\n", "#@ abc\n", "#$\n", "#$ abc\n"):
+            with self.assertRaises(leapseconddata.InvalidContentError):
+                leapseconddata.LeapSecondData.from_data(content, check_hash=False)
+
+    def test_odd_whitespace(self) -> None:
+        db1 = leapseconddata.LeapSecondData.from_data(b"2272060800 10\x0b\n", check_hash=False)
+        self.assertEqual(len(db1.leap_seconds), 1)
+        db2 = leapseconddata.LeapSecondData.from_data(b"\x0c2272060800 10\n", check_hash=False)
+        self.assertEqual(len(db2.leap_seconds), 1)
+
+    def test_crlf(self) -> None:
+        content = "2272060800 10\r\n#h 2c0a50f1 27d98e6e dc928a84 6a109474 68eb871f\r\n"
+        db1 = leapseconddata.LeapSecondData.from_data(content)
+        self.assertEqual(len(db1.leap_seconds), 1)
 
     def test_invalid(self) -> None:
         valid_until = db.valid_until
@@ -73,6 +127,13 @@ class LeapSecondDataTest(unittest.TestCase):
             db.tai_offset,
             valid_until + datetime.timedelta(seconds=1),
         )
+        # A fractional second past the boundary must not be truncated back
+        # into validity
+        self.assertRaises(
+            leapseconddata.ValidityError,
+            db.tai_offset,
+            valid_until + datetime.timedelta(seconds=0.5),
+        )
         db1 = leapseconddata.LeapSecondData(
             [
                 leapseconddata.LeapSecondInfo(
@@ -81,6 +142,7 @@ class LeapSecondDataTest(unittest.TestCase):
                 ),
             ],
         )
+        self.assertIsNone(db._check_validity(valid_until.timestamp()))
         self.assertRaises(leapseconddata.ValidityError, db1.tai_offset, db.valid_until)
         self.assertEqual(db1.tai_offset(valid_until, check_validity=False), datetime.timedelta(seconds=1))
 
@@ -107,6 +169,64 @@ class LeapSecondDataTest(unittest.TestCase):
                 ],
             )
 
+    def test_from_file(self) -> None:
+        content = b"#$ 3676924800\n#@ 4291747200\n2272060800 10 # 1 Jan 1972\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / "leap-seconds.list"
+            path.write_bytes(content)
+            db1 = leapseconddata.LeapSecondData.from_file(str(path), check_hash=False)
+            db2 = leapseconddata.LeapSecondData.from_file(str(path), check_hash=False)
+            self.assertIs(db1, db2)
+            path.write_bytes(content + b"2287785600 11\n")
+            db3 = leapseconddata.LeapSecondData.from_file(str(path), check_hash=False)
+            self.assertIsNot(db1, db3)
+            self.assertEqual(len(db3.leap_seconds), 2)
+
+            db4 = leapseconddata.LeapSecondData.from_standard_source(
+                check_hash=False,
+                custom_sources=[path.as_uri()],
+            )
+            self.assertEqual(db4.leap_seconds, db3.leap_seconds)
+
+    def test_network_sources(self) -> None:
+        content = "#$ 3676924800\n#@ 4291747200\n2272060800 10\n"
+        url = "data:text/plain," + urllib.parse.quote(content)
+        old_files = leapseconddata.LeapSecondData.standard_file_sources
+        old_network = leapseconddata.LeapSecondData.standard_network_sources
+        leapseconddata.LeapSecondData.standard_file_sources = []
+        leapseconddata.LeapSecondData.standard_network_sources = [url]
+        logging.getLogger("leapseconddata").setLevel(logging.DEBUG)
+        try:
+            db1 = leapseconddata.LeapSecondData.from_standard_source(
+                check_hash=False,
+                custom_sources=["file:///doesnotexist"],
+            )
+        finally:
+            leapseconddata.LeapSecondData.standard_file_sources = old_files
+            leapseconddata.LeapSecondData.standard_network_sources = old_network
+            logging.getLogger("leapseconddata").setLevel(logging.NOTSET)
+        self.assertEqual(len(db1.leap_seconds), 1)
+
+    def test_standard_source_cache(self) -> None:
+        old_cache = leapseconddata.LeapSecondData._standard_source_cache
+        leapseconddata.LeapSecondData._standard_source_cache = None
+        try:
+            d1 = leapseconddata.LeapSecondData.from_standard_source(check_hash=False)
+            d2 = leapseconddata.LeapSecondData.from_standard_source()
+            # The unverified instance must not satisfy a hash-checking caller
+            self.assertIsNot(d1, d2)
+            d3 = leapseconddata.LeapSecondData.from_standard_source(check_hash=False)
+            self.assertIs(d2, d3)
+        finally:
+            leapseconddata.LeapSecondData._standard_source_cache = old_cache
+
+    def test_url_cache(self) -> None:
+        url = "data:text/plain,%23h%099dac5845%208acd32c0%202947d462%20daf4a943%20f58d9391%0A"
+        db1 = leapseconddata.LeapSecondData.from_url(url, check_hash=False)
+        db2 = leapseconddata.LeapSecondData.from_url(url, check_hash=False)
+        self.assertIsNotNone(db1)
+        self.assertIs(db1, db2)
+
     def test_tz(self) -> None:
         when = datetime.datetime(1999, 1, 1, tzinfo=datetime.timezone.utc) - datetime.timedelta(seconds=1)
         when = when.replace(fold=True)
@@ -119,6 +239,14 @@ class LeapSecondDataTest(unittest.TestCase):
         self.assertFalse(db.is_leap_second(when - datetime.timedelta(seconds=1)))
         self.assertFalse(db.is_leap_second(when + datetime.timedelta(seconds=1)))
 
+        when_tai = datetime.datetime(1999, 1, 1, 0, 0, 31, tzinfo=leapseconddata.tai)
+        self.assertTrue(db.is_leap_second(when_tai, check_validity=False))
+
+        valid_until = db.valid_until
+        assert valid_until
+        expired_tai = (valid_until + datetime.timedelta(seconds=1)).replace(tzinfo=leapseconddata.tai)
+        self.assertRaises(leapseconddata.ValidityError, db.is_leap_second, expired_tai)
+
         when_tai = datetime.datetime(1999, 1, 1, 0, 0, 32, tzinfo=leapseconddata.tai)
         when_utc = db.tai_to_utc(when_tai)
         self.assertIs(when_utc.tzinfo, datetime.timezone.utc)
@@ -136,6 +264,59 @@ class LeapSecondDataTest(unittest.TestCase):
         assert when_tai.tzinfo is leapseconddata.tai
         assert when_tai2.tzinfo is leapseconddata.tai
 
+    def test_stream(self) -> None:
+        whens = [
+            datetime.datetime(1990, 1, 1, tzinfo=datetime.timezone.utc),
+            datetime.datetime(1998, 12, 31, 23, 59, 59, tzinfo=datetime.timezone.utc),
+            datetime.datetime(1999, 1, 1, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2011, 1, 1, tzinfo=datetime.timezone.utc),
+        ]
+        stream = leapseconddata.LeapSecondStream(db)
+        self.assertEqual(list(stream.convert_many(whens)), [db.to_tai(when) for when in whens])
+
+        valid_until = db.valid_until
+        assert valid_until
+        stream = leapseconddata.LeapSecondStream(db)
+        with self.assertRaises(leapseconddata.ValidityError):
+            list(stream.convert_many([valid_until + datetime.timedelta(seconds=1)]))
+
+        stream = leapseconddata.LeapSecondStream(db, check_validity=False)
+        offset = stream.tai_offset(valid_until + datetime.timedelta(days=1))
+        self.assertEqual(offset, db.leap_seconds[-1].tai_offset)
+
+        stream = leapseconddata.LeapSecondStream(leapseconddata.LeapSecondData([]), check_validity=False)
+        self.assertEqual(stream.tai_offset(whens[0]), datetime.timedelta(0))
+
+    def test_tai_offset_many(self) -> None:
+        whens = np.array(["1950-01-01", "1999-01-01", "2009-01-01"], dtype="datetime64[s]")
+        offsets = db.tai_offset_many(whens)
+        self.assertEqual(
+            offsets.tolist(),
+            [
+                datetime.timedelta(0),
+                datetime.timedelta(seconds=32),
+                datetime.timedelta(seconds=34),
+            ],
+        )
+
+        when = datetime.datetime(2011, 1, 1, tzinfo=datetime.timezone.utc)
+        offsets = db.tai_offset_many(np.array([when.timestamp()]))
+        self.assertEqual(offsets.tolist(), [db.tai_offset(when)])
+
+        far_past = np.array(["1000-01-01"], dtype="datetime64[s]")
+        self.assertEqual(db.tai_offset_many(far_past, check_validity=False).tolist(), [datetime.timedelta(0)])
+
+        valid_until = db.valid_until
+        assert valid_until
+        self.assertRaises(
+            leapseconddata.ValidityError,
+            db.tai_offset_many,
+            np.array([(valid_until + datetime.timedelta(seconds=1)).timestamp()]),
+        )
+        db1 = leapseconddata.LeapSecondData([])
+        self.assertRaises(leapseconddata.ValidityError, db1.tai_offset_many, whens)
+        self.assertEqual(db1.tai_offset_many(whens, check_validity=False).tolist(), [datetime.timedelta(0)] * 3)
+
     def test_to_tai_naive(self) -> None:
         when = datetime.datetime(1999, 1, 1, tzinfo=None) - datetime.timedelta(seconds=1)  # noqa: DTZ001
         when_tai = db.to_tai(when)
@@ -143,17 +324,20 @@ class LeapSecondDataTest(unittest.TestCase):
         when_tai2 = db.to_tai(when2)
         self.assertEqual(when_tai, when_tai2)
 
-    def assertPrints(self, code: str, expected: str) -> None:  # noqa: N802
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(db.tai_offset(when), db.tai_offset(when2))
+
+    def assertPrints(self, code: str, expected: str, filename: str = "<string>") -> None:  # noqa: N802
         buf = io.StringIO()
         with contextlib.redirect_stdout(buf):
-            exec(code, {}, {})
+            exec(compile(code, filename, "exec"), {})
         self.assertEqual(expected, buf.getvalue())
 
     def test_doc(self) -> None:
         docs = pathlib.Path(__file__).parent / "docs"
-        for expected in docs.rglob("**/*.py.exp"):
+        for expected in docs.rglob("*.py.exp"):
             py = expected.with_suffix("")  # Pop off the ".exp" suffix
-            self.assertPrints(py.read_text(encoding="utf-8"), expected.read_text(encoding="utf-8"))
+            self.assertPrints(py.read_bytes().decode("utf-8"), expected.read_bytes().decode("utf-8"), str(py))
 
 
 if __name__ == "__main__":  # pragma: no cover